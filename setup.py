@@ -82,6 +82,15 @@ setuptools.setup(
         "setuptools>=52.0.0"
     ],
     extras_require={
+        'orjson': [
+            'orjson>=3.0.0'
+        ],
+        'async': [
+            'httpx[http2]>=0.23.0'
+        ],
+        'streaming': [
+            'ijson>=3.1'
+        ],
         'sphinx': [
             'Sphinx>=3.4.0',
             'sphinxcontrib-applehelp>=1.0.2',
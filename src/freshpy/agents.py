@@ -108,10 +108,20 @@ def _get_user_info_by_email(_freshpy_object, _email, _verify_ssl=True):
 
 
 def get_all_agents(
-    freshpy_object, only_active=None, only_inactive=None, verify_ssl=True
+    freshpy_object,
+    only_active=None,
+    only_inactive=None,
+    verify_ssl=True,
+    all_pages=False,
+    concurrency=api.DEFAULT_CONCURRENCY,
+    timeout=api.DEFAULT_TIMEOUT,
 ):
     """This function returns data for all agents with an optional filters for active or inactive users.
 
+    .. versionchanged:: 2.1.0
+       Introduced the ``all_pages`` and ``concurrency`` parameters to retrieve all pages concurrently
+       and the ``timeout`` parameter to limit the time spent on each request.
+
     .. versionadded:: 2.0.0
 
     :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
@@ -122,8 +132,15 @@ def get_all_agents(
     :type only_inactive: bool, None
     :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
     :type verify_ssl: bool
+    :param all_pages: Retrieves all pages of agents when ``True`` (only the first page is returned by default)
+    :type all_pages: bool
+    :param concurrency: The maximum number of pages to retrieve concurrently when ``all_pages`` is ``True``
+    :type concurrency: int
+    :param timeout: The maximum number of seconds to spend on each request including retries (``120`` by default)
+    :type timeout: int, float, None
     :returns: JSON data with user data for all agents
-    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
     """
     # Define the filter string if necessary
     filter_string = ""
@@ -138,7 +155,18 @@ def get_all_agents(
 
     # Construct the URI and perform the API call
     uri = "agents" + filter_string
-    return api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl)
+    if all_pages:
+        return api.get_all_pages(
+            freshpy_object,
+            uri,
+            "agents",
+            concurrency=concurrency,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+        )
+    return api.get_request_with_retries(
+        freshpy_object, uri, verify_ssl=verify_ssl, timeout=timeout
+    )
 
 
 def get_agent_id(freshpy_object, email, verify_ssl=True):
@@ -7,29 +7,90 @@
 :Modified Date:     29 Jan 2025
 """
 
+import ssl
+import copy
+import math
 import requests
 import time
 import random
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 from . import errors
 from .utils import log_utils
 
+# Leverage the faster orjson decoder when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Import the optional httpx package used for asynchronous API calls
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Import the optional ijson package used to incrementally parse streamed responses
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Initialize logging
 logger = log_utils.initialize_logging(__name__)
 
+# Define constants
+MAX_RETRIES = 5
+RETRY_STATUS_CODES = [429, 502, 503, 504]
+BASE_RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+DEFAULT_TIMEOUT = 120  # Long enough to wait out a per-minute rate limit window and retry the request
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 30
+DEFAULT_PAGE_SIZE = 30
+DEFAULT_CONCURRENCY = 4
+PAGE_LIMIT = 1000
+RECOVERABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+UNRECOVERABLE_EXCEPTIONS = (
+    requests.exceptions.SSLError,
+    requests.exceptions.InvalidURL,
+    requests.exceptions.MissingSchema,
+    requests.exceptions.InvalidSchema,
+)
+if httpx is not None:
+    ASYNC_RECOVERABLE_EXCEPTIONS = (
+        httpx.TimeoutException,
+        httpx.NetworkError,
+        httpx.RemoteProtocolError,
+    )
+else:
+    ASYNC_RECOVERABLE_EXCEPTIONS = ()
+
 
 def define_headers():
     """This function defines the headers to use in API calls.
 
+    .. versionchanged:: 2.1.0
+       Added the ``Accept-Encoding`` header to request compressed responses.
+
+    .. note:: The core object calls this function once when instantiated and applies the headers to its session.
+
     .. versionadded:: 1.0.0
     """
-    headers = {"Content-Type": "application/json"}
+    headers = {"Content-Type": "application/json", "Accept-Encoding": "gzip, deflate"}
     return headers
 
 
 def define_auth(api_key):
     """This function defines the authentication dictionary to use in API calls.
 
+    .. note:: The core object calls this function once when instantiated and applies the credentials to its session.
+
     .. versionadded:: 1.0.0
     """
     credentials = (api_key, "X")
@@ -37,10 +98,28 @@ def define_auth(api_key):
 
 
 def get_request_with_retries(
-    fresh_object, uri, headers=None, return_json=True, verify_ssl=True
+    fresh_object,
+    uri,
+    headers=None,
+    return_json=True,
+    verify_ssl=True,
+    timeout=DEFAULT_TIMEOUT,
+    deadline=None,
+    stream=False,
+    stream_prefix="item",
 ):
     """This function performs a GET request and will retry several times if a failure occurs.
 
+    .. versionchanged:: 2.1.0
+       The request is now performed using the :py:class:`requests.Session` of the core object
+       so that connections are reused between calls, and throttled (``429``) or unavailable
+       (``502``, ``503`` and ``504``) responses are retried with exponential backoff. JSON responses
+       are also cached when the ``cache_ttl`` of the core object is defined. Only transient connection
+       errors and timeouts are now retried, whereas SSL and URL errors are raised immediately. Non-JSON
+       responses now return an error dictionary without attempting to decode the response. Introduced
+       the ``timeout`` and ``deadline`` parameters to limit the total time spent across all retries, and
+       the ``stream`` and ``stream_prefix`` parameters to incrementally parse large JSON responses.
+
     .. versionchanged:: 2.0.0
        Added error handling for 404 responses and exceptions when converting response to JSON.
 
@@ -58,57 +137,757 @@ def get_request_with_retries(
     :type return_json: bool
     :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
     :type verify_ssl: bool
-    :returns: The JSON data from the response or the raw :py:mod:`requests` response.
-    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+    :param timeout: The maximum number of seconds to spend on the request including retries (``120`` by default)
+                    (the default allows a throttled request to wait out a per-minute rate limit window, whereas
+                    a ``Retry-After`` delay longer than the remaining time raises an exception immediately,
+                    so use ``None`` to always wait for the delay requested by the server)
+    :type timeout: int, float, None
+    :param deadline: An absolute :py:func:`time.monotonic` value by which the request must complete
+                     (overrides the ``timeout`` parameter when defined)
+    :type deadline: float, None
+    :param stream: Returns a generator that parses the JSON records as they are received when ``True``
+                   (requires the optional :py:mod:`ijson` package)
+    :type stream: bool
+    :param stream_prefix: The :py:mod:`ijson` prefix of the records to yield when streaming (``item`` by default)
+    :type stream_prefix: str
+    :returns: The JSON data from the response (or a generator of records when streaming) or the raw
+              :py:mod:`requests` response.
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.MissingDependencyError`,
+             :py:exc:`requests.exceptions.SSLError`,
+             :py:exc:`requests.exceptions.InvalidURL`
     """
-    # Define headers if not supplied
-    headers = define_headers() if not headers else headers
+    if stream and ijson is None:
+        raise errors.exceptions.MissingDependencyError(package="ijson")
+
+    # Return the cached response if caching is enabled and the data has not expired
+    cache_key = None if stream else _get_cache_key(fresh_object, uri, headers, return_json)
+    if cache_key is not None:
+        cached_response = _get_cached_response(fresh_object, cache_key)
+        if cached_response is not None:
+            return cached_response
+
+    # Define the absolute deadline for the request including any retries
+    timeout = None if deadline is not None else timeout
+    deadline = _define_deadline(timeout, deadline)
+
+    # Share the result of an identical request that is already in progress rather than duplicating it
+    request_args = (
+        fresh_object, uri, headers, return_json, verify_ssl, timeout, deadline, stream, stream_prefix, cache_key
+    )
+    if return_json and not stream:
+        inflight_key = (uri, frozenset((headers or {}).items()), verify_ssl)
+        return _coalesce_request(fresh_object, inflight_key, deadline, timeout, request_args)
+    return _perform_get_request(*request_args)
 
-    # Construct the credentials dictionary
-    credentials = define_auth(fresh_object.api_key)
 
+def _perform_get_request(
+    _fresh_object,
+    _uri,
+    _headers,
+    _return_json,
+    _verify_ssl,
+    _timeout,
+    _deadline,
+    _stream=False,
+    _stream_prefix="item",
+    _cache_key=None,
+):
+    """This function performs a GET request and will retry several times if a failure occurs.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Refer to the :py:func:`freshpy.api.get_request_with_retries` function for details on the parameters.
+
+    :returns: The JSON data from the response (or a generator of records when streaming) or the raw
+              :py:mod:`requests` response.
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`requests.exceptions.SSLError`,
+             :py:exc:`requests.exceptions.InvalidURL`
+    """
     # Construct the query URL
-    query_url = fresh_object.base_url + uri
+    _query_url = _fresh_object.base_url + _uri.lstrip("/")
+
+    # Perform the API call using the session (which supplies the default headers and credentials)
+    _backoff = BackoffStrategy(_uri, _deadline, _timeout)
+    _retries, _response = 0, None
+    while _retries <= MAX_RETRIES:
+        _request_timeout = _get_request_timeout(_deadline, _timeout)
+        try:
+            _response = _fresh_object.session.get(
+                _query_url,
+                headers=_headers,
+                verify=_verify_ssl,
+                timeout=_request_timeout,
+                stream=_stream,
+            )
+        except UNRECOVERABLE_EXCEPTIONS:
+            # Fail fast as retrying will not resolve these errors
+            raise
+        except RECOVERABLE_EXCEPTIONS as _exc_msg:
+            _report_failed_attempt(_exc_msg, "get", _retries)
+            if _retries < MAX_RETRIES:
+                _backoff.wait(_retries)
+            _retries += 1
+            continue
+
+        # Back off and retry if the request was throttled or the service is temporarily unavailable
+        if _response.status_code in RETRY_STATUS_CODES and _retries < MAX_RETRIES:
+            _response.close()
+            _backoff.wait(_retries, _response)
+            _retries += 1
+            continue
+        break
+    if _retries > MAX_RETRIES:
+        _raise_exception_for_repeated_timeouts()
+    if _response.status_code in RETRY_STATUS_CODES:
+        _response.close()
+        _raise_exception_for_repeated_timeouts(_response)
+    if _stream and _return_json:
+        if _is_successful_json_response(_response):
+            return _stream_json_items(_response, _stream_prefix)
+
+        # Release the connection of the streamed response once the error details have been read
+        try:
+            return _process_response(_fresh_object, _response, _return_json, _cache_key)
+        finally:
+            _response.close()
+    return _process_response(_fresh_object, _response, _return_json, _cache_key)
+
+
+def _coalesce_request(_fresh_object, _inflight_key, _deadline, _timeout, _request_args):
+    """This function performs a GET request unless an identical request is already in progress, in which case
+       the result of that request is returned instead.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Each waiting request receives its own copy of the JSON data so that it can be safely modified.
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _inflight_key: The key that identifies identical requests (the URI, headers and SSL verification)
+    :type _inflight_key: tuple
+    :param _deadline: The absolute :py:func:`time.monotonic` value by which the request must complete
+    :type _deadline: float, None
+    :param _timeout: The timeout (in seconds) used to define the deadline
+    :type _timeout: int, float, None
+    :param _request_args: The arguments to pass to the :py:func:`freshpy.api._perform_get_request` function
+    :type _request_args: tuple
+    :returns: The JSON data from the response
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+    """
+    with _fresh_object._inflight_lock:
+        _inflight = _fresh_object._inflight.get(_inflight_key)
+        _is_leader = _inflight is None
+        if _is_leader:
+            _inflight = _fresh_object._inflight[_inflight_key] = [Future(), 0]
+        else:
+            _inflight[1] += 1
+    _future = _inflight[0]
+
+    # Wait for the request that is already in progress (within the deadline of this request)
+    if not _is_leader:
+        try:
+            _response = _future.result(
+                timeout=None if _deadline is None else max(0, _deadline - time.monotonic())
+            )
+        except FutureTimeoutError:
+            _raise_exception_for_exceeded_deadline(_timeout)
+        return copy.deepcopy(_response)
+
+    # Perform the request and share the result (or exception) with any requests that are waiting
+    _response, _exception = None, None
+    try:
+        _response = _perform_get_request(*_request_args)
+    except BaseException as _exc:
+        _exception = _exc
+        raise
+    finally:
+        with _fresh_object._inflight_lock:
+            _, _waiting = _fresh_object._inflight.pop(_inflight_key)
+        if _exception is not None:
+            _future.set_exception(_exception)
+        else:
+            # Share a separate copy so that changes made by this caller do not affect the waiting requests
+            _future.set_result(copy.deepcopy(_response) if _waiting else _response)
+    return _response
+
+
+async def aget_request_with_retries(
+    fresh_object,
+    uri,
+    headers=None,
+    return_json=True,
+    verify_ssl=True,
+    timeout=DEFAULT_TIMEOUT,
+    deadline=None,
+):
+    """This function asynchronously performs a GET request and will retry several times if a failure occurs.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: This function requires the optional :py:mod:`httpx` package.
+
+    :param fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param uri: The URI to query
+    :type uri: string
+    :param headers: The HTTP headers to utilize in the REST API call
+    :type headers: dict, None
+    :param return_json: Determines if JSON data should be returned
+    :type return_json: bool
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param timeout: The maximum number of seconds to spend on the request including retries (``120`` by default)
+                    (the default allows a throttled request to wait out a per-minute rate limit window, whereas
+                    a ``Retry-After`` delay longer than the remaining time raises an exception immediately,
+                    so use ``None`` to always wait for the delay requested by the server)
+    :type timeout: int, float, None
+    :param deadline: An absolute :py:func:`time.monotonic` value by which the request must complete
+                     (overrides the ``timeout`` parameter when defined)
+    :type deadline: float, None
+    :returns: The JSON data from the response or the raw :py:mod:`httpx` response.
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.MissingDependencyError`,
+             :py:exc:`httpx.ConnectError`
+    """
+    # Return the cached response if caching is enabled and the data has not expired
+    cache_key = _get_cache_key(fresh_object, uri, headers, return_json)
+    if cache_key is not None:
+        cached_response = _get_cached_response(fresh_object, cache_key)
+        if cached_response is not None:
+            return cached_response
 
-    # Perform the API call
+    # Define the absolute deadline for the request including any retries
+    timeout = None if deadline is not None else timeout
+    deadline = _define_deadline(timeout, deadline)
+
+    # Perform the API call using the asynchronous client of the core object
+    client = await fresh_object._get_async_client(verify_ssl)
+    backoff = BackoffStrategy(uri, deadline, timeout)
     retries, response = 0, None
-    while retries <= 5:
+    while retries <= MAX_RETRIES:
+        connect_timeout, read_timeout = _get_request_timeout(deadline, timeout)
         try:
-            response = requests.get(
-                query_url, headers=headers, auth=credentials, verify=verify_ssl
+            response = await client.get(
+                uri,
+                headers=headers,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
             )
-            break
-        except Exception as exc_msg:
+        except ASYNC_RECOVERABLE_EXCEPTIONS as exc_msg:
+            # Fail fast as retrying will not resolve SSL errors (which httpx reports as connection errors)
+            if _is_ssl_error(exc_msg):
+                raise
             _report_failed_attempt(exc_msg, "get", retries)
+            if retries < MAX_RETRIES:
+                await backoff.awaitable(retries)
+            retries += 1
+            continue
+
+        # Back off and retry if the request was throttled or the service is temporarily unavailable
+        if response.status_code in RETRY_STATUS_CODES and retries < MAX_RETRIES:
+            await response.aclose()
+            await backoff.awaitable(retries, response)
             retries += 1
-    if retries == 6:
+            continue
+        break
+    if retries > MAX_RETRIES:
         _raise_exception_for_repeated_timeouts()
-    if return_json:
-        if response.status_code == 429:
-            delay = (5**retries) + (random.random() * 5)
-            print(f"Rate detected. Retrying in {delay:.2f}s")
-            time.sleep(delay)
-        if response.status_code == 404:
-            response = {
-                "status": "error",
-                "status_code": 404,
-                "error_message": "Data not found",
-            }
-        else:
-            try:
-                response = response.json()
-            except Exception as exc_msg:
-                response = {
-                    "status": "exception",
-                    "status_code": None,
-                    "error_message": str(exc_msg),
-                }
-    return response
+    if response.status_code in RETRY_STATUS_CODES:
+        _raise_exception_for_repeated_timeouts(response)
+    return _process_response(fresh_object, response, return_json, cache_key)
+
+
+def _is_ssl_error(_exc):
+    """This function determines if an exception was caused by an SSL error.
+
+    .. versionadded:: 2.1.0
+
+    :param _exc: The exception that was raised within a try/except clause
+    :returns: Boolean value indicating if the exception (or one of its causes) is an :py:exc:`ssl.SSLError`
+    """
+    while _exc is not None:
+        if isinstance(_exc, ssl.SSLError):
+            return True
+        _exc = _exc.__cause__ or _exc.__context__
+    return False
+
+
+def _process_response(_fresh_object, _response, _return_json, _cache_key=None):
+    """This function converts an API response into JSON data and caches it when applicable.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _response: The :py:mod:`requests` or :py:mod:`httpx` response
+    :param _return_json: Determines if JSON data should be returned
+    :type _return_json: bool
+    :param _cache_key: The key with which to cache the JSON data (``None`` if caching is disabled)
+    :type _cache_key: tuple, None
+    :returns: The JSON data from the response or the raw response
+    """
+    if not _return_json:
+        return _response
+    if _response.status_code == 404:
+        return {
+            "status": "error",
+            "status_code": 404,
+            "error_message": "Data not found",
+        }
+
+    # Avoid invoking the JSON parser when the response is not JSON (e.g. an HTML error page)
+    if "json" not in _response.headers.get("Content-Type", ""):
+        return {
+            "status": "error",
+            "status_code": _response.status_code,
+            "error_message": _response.text[:512],
+        }
+
+    # Decode the JSON data and cache it when applicable
+    try:
+        _data = _decode_json(_response)
+    except Exception as _exc_msg:
+        return {
+            "status": "exception",
+            "status_code": None,
+            "error_message": str(_exc_msg),
+        }
+    if _cache_key is not None and _response.status_code < 400:
+        _cache_response(_fresh_object, _cache_key, _data)
+    return _data
+
+
+def _is_successful_json_response(_response):
+    """This function determines if a response was successful and contains JSON data.
+
+    .. versionadded:: 2.1.0
+
+    :param _response: The :py:mod:`requests` or :py:mod:`httpx` response
+    :returns: Boolean value indicating if the response is successful and contains JSON data
+    """
+    return _response.status_code < 400 and "json" in _response.headers.get("Content-Type", "")
+
+
+def _stream_json_items(_response, _prefix="item"):
+    """This function incrementally parses a streamed JSON response and yields the records it contains.
+
+    .. versionadded:: 2.1.0
+
+    :param _response: The :py:mod:`requests` response retrieved with ``stream=True``
+    :param _prefix: The :py:mod:`ijson` prefix of the records to yield (``item`` by default)
+    :type _prefix: str
+    :returns: A generator that yields the JSON data for each record
+    """
+    try:
+        # Ensure compressed responses are decoded before they are parsed
+        _response.raw.decode_content = True
+        for _item in ijson.items(_response.raw, _prefix, use_float=True):
+            yield _item
+    finally:
+        _response.close()
+
+
+def _decode_json(_response):
+    """This function decodes the JSON data in a response, using :py:mod:`orjson` when it is installed.
+
+    .. versionadded:: 2.1.0
+
+    :param _response: The :py:mod:`requests` response
+    :returns: The decoded JSON data
+    :raises: :py:exc:`ValueError`
+    """
+    if orjson is not None:
+        return orjson.loads(_response.content)
+    return _response.json()
+
+
+def get_all_pages(
+    fresh_object,
+    uri,
+    data_key,
+    page_size=None,
+    start_page=1,
+    concurrency=DEFAULT_CONCURRENCY,
+    verify_ssl=True,
+    timeout=DEFAULT_TIMEOUT,
+):
+    """This function retrieves every page of a paginated endpoint, fetching pages concurrently.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The API does not report the total number of pages, so after the first page is retrieved the
+              subsequent pages are requested in batches (one page per worker) until a page is returned that
+              is empty or shorter than the page size. An exception is raised if a subsequent page returns an
+              error, or if the final page permitted by the ``PAGE_LIMIT`` constant (``1000`` pages) is still
+              full, rather than silently returning the records retrieved so far.
+
+    :param fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param uri: The URI to query (without the ``page`` parameter)
+    :type uri: str
+    :param data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type data_key: str
+    :param page_size: The number of records per page (``30`` by default)
+    :type page_size: str, int, None
+    :param start_page: The first page to retrieve (``1`` by default)
+    :type start_page: str, int
+    :param concurrency: The maximum number of pages to retrieve concurrently (``4`` by default)
+    :type concurrency: int
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param timeout: The maximum number of seconds to spend on each page including retries (``120`` by default)
+    :type timeout: int, float, None
+    :returns: The JSON data with the records from all pages under the ``data_key`` key
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    page_size = int(page_size) if page_size else DEFAULT_PAGE_SIZE
+    concurrency = max(1, int(concurrency))
+    page = int(start_page)
+
+    def _get_page(_page):
+        return get_request_with_retries(
+            fresh_object, _append_page(uri, _page), verify_ssl=verify_ssl, timeout=timeout
+        )
+
+    # Return the first response as-is if it does not contain any records (e.g. an error response)
+    response = _get_page(page)
+    if not isinstance(response, dict) or not response.get(data_key):
+        return response
+    records = list(response[data_key])
+    if len(response[data_key]) < page_size:
+        return {data_key: records}
+
+    # Retrieve the remaining pages in batches while preserving the page order
+    last_page = page + PAGE_LIMIT - 1
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while page < last_page:
+            pages = range(page + 1, min(page + concurrency, last_page) + 1)
+            for response in executor.map(_get_page, pages):
+                # An error response for a subsequent page must not be mistaken for the end of the data
+                if not isinstance(response, dict) or data_key not in response:
+                    _raise_exception_for_unexpected_response(response)
+                page_records = response[data_key]
+                if not page_records:
+                    return {data_key: records}
+                records.extend(page_records)
+                if len(page_records) < page_size:
+                    return {data_key: records}
+            page = pages[-1]
+    _raise_exception_for_page_limit()
+
+
+def iter_all_pages(
+    fresh_object,
+    uri,
+    data_key,
+    page_size=None,
+    start_page=1,
+    verify_ssl=True,
+    timeout=DEFAULT_TIMEOUT,
+    stream=False,
+):
+    """This function yields the records from every page of a paginated endpoint while prefetching the next page.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: At most two pages are held in memory at a time, as the next page is retrieved in a background
+              thread while the records from the current page are being consumed. When ``stream`` is ``True``, the
+              records are instead parsed incrementally as each page is received so that only a single record
+              is held in memory at a time. Pages retrieved without streaming are also kept in the response cache
+              (up to the ``cache_maxsize`` of the core object) when its ``cache_ttl`` is defined, which negates
+              this memory bound. An exception is raised after the records are yielded if the final
+              page permitted by the ``PAGE_LIMIT`` constant (``1000`` pages) is still full.
+
+    :param fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param uri: The URI to query (without the ``page`` parameter)
+    :type uri: str
+    :param data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type data_key: str
+    :param page_size: The number of records per page (``30`` by default)
+    :type page_size: str, int, None
+    :param start_page: The first page to retrieve (``1`` by default)
+    :type start_page: str, int
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param timeout: The maximum number of seconds to spend on each page including retries (``120`` by default)
+    :type timeout: int, float, None
+    :param stream: Parses the records incrementally as each page is received (requires the :py:mod:`ijson` package)
+    :type stream: bool
+    :returns: A generator that yields the JSON data for each record
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`,
+             :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    page_size = int(page_size) if page_size else DEFAULT_PAGE_SIZE
+    page = int(start_page)
+    if stream:
+        yield from _iter_streamed_pages(fresh_object, uri, data_key, page_size, page, verify_ssl, timeout)
+        return
+
+    def _get_page(_page):
+        return get_request_with_retries(
+            fresh_object, _append_page(uri, _page), verify_ssl=verify_ssl, timeout=timeout
+        )
+
+    last_page = page + PAGE_LIMIT - 1
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(_get_page, page)
+        while True:
+            response = future.result()
+            if not isinstance(response, dict) or data_key not in response:
+                _raise_exception_for_unexpected_response(response)
+            page_records = response[data_key]
+            if not page_records:
+                return
+
+            # Retrieve the next page in the background while the current page is consumed
+            more_pages = len(page_records) == page_size
+            if more_pages and page < last_page:
+                future = executor.submit(_get_page, page + 1)
+            for record in page_records:
+                yield record
+            if not more_pages:
+                return
+            if page >= last_page:
+                _raise_exception_for_page_limit()
+            page += 1
+
+
+def _iter_streamed_pages(_fresh_object, _uri, _data_key, _page_size, _page, _verify_ssl=True, _timeout=None):
+    """This function yields the records from every page of a paginated endpoint as each page is streamed.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _uri: The URI to query (without the ``page`` parameter)
+    :type _uri: str
+    :param _data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type _data_key: str
+    :param _page_size: The number of records per page
+    :type _page_size: int
+    :param _page: The first page to retrieve
+    :type _page: int
+    :param _verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type _verify_ssl: bool
+    :param _timeout: The maximum number of seconds to spend on each page including retries
+    :type _timeout: int, float, None
+    :returns: A generator that yields the JSON data for each record
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`,
+             :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    _last_page = _page + PAGE_LIMIT - 1
+    while _page <= _last_page:
+        _response = get_request_with_retries(
+            _fresh_object,
+            _append_page(_uri, _page),
+            verify_ssl=_verify_ssl,
+            timeout=_timeout,
+            stream=True,
+            stream_prefix=f"{_data_key}.item",
+        )
+
+        # Unsuccessful responses are returned as an error dictionary rather than a generator
+        if isinstance(_response, dict):
+            _raise_exception_for_unexpected_response(_response)
+        _record_count = 0
+        for _record in _response:
+            _record_count += 1
+            yield _record
+        if _record_count < _page_size:
+            return
+        _page += 1
+    _raise_exception_for_page_limit()
+
+
+def _raise_exception_for_unexpected_response(_response):
+    """This function raises an exception when a paginated response does not contain the expected records.
+
+    .. versionadded:: 2.1.0
+
+    :param _response: The JSON data (or error dictionary) returned by the API call
+    :returns: None
+    :raises: :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    if isinstance(_response, dict) and _response.get("status_code"):
+        raise errors.exceptions.GETRequestError(
+            status_code=_response["status_code"], message=str(_response)
+        )
+    raise errors.exceptions.GETRequestError(message=str(_response))
+
+
+def _raise_exception_for_page_limit():
+    """This function raises an exception when the page limit is reached before all records were retrieved.
+
+    .. versionadded:: 2.1.0
+
+    :returns: None
+    :raises: :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    raise errors.exceptions.GETRequestError(
+        message=f"The limit of {PAGE_LIMIT} pages was reached before all records were retrieved. "
+        + "Increase the page size or narrow the query with filters."
+    )
+
+
+def _append_page(_uri, _page):
+    """This function appends the ``page`` query parameter to a URI.
+
+    .. versionadded:: 2.1.0
+
+    :param _uri: The URI to which the parameter should be appended
+    :type _uri: str
+    :param _page: The page number
+    :type _page: int
+    :returns: The URI with the ``page`` query parameter
+    """
+    _separator = "&" if "?" in _uri else "?"
+    return f"{_uri}{_separator}page={_page}"
+
+
+async def aget_all_pages(
+    fresh_object,
+    uri,
+    data_key,
+    page_size=None,
+    start_page=1,
+    concurrency=DEFAULT_CONCURRENCY,
+    verify_ssl=True,
+    timeout=DEFAULT_TIMEOUT,
+):
+    """This function asynchronously retrieves every page of a paginated endpoint, fetching pages concurrently.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: This function requires the optional :py:mod:`httpx` package and retrieves pages in the same
+              batches as the :py:func:`freshpy.api.get_all_pages` function.
+
+    :param fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param uri: The URI to query (without the ``page`` parameter)
+    :type uri: str
+    :param data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type data_key: str
+    :param page_size: The number of records per page (``30`` by default)
+    :type page_size: str, int, None
+    :param start_page: The first page to retrieve (``1`` by default)
+    :type start_page: str, int
+    :param concurrency: The maximum number of pages to retrieve concurrently (``4`` by default)
+    :type concurrency: int
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param timeout: The maximum number of seconds to spend on each page including retries (``120`` by default)
+    :type timeout: int, float, None
+    :returns: The JSON data with the records from all pages under the ``data_key`` key
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`,
+             :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    page_size = int(page_size) if page_size else DEFAULT_PAGE_SIZE
+    concurrency = max(1, int(concurrency))
+    page = int(start_page)
+
+    def _get_page(_page):
+        return aget_request_with_retries(
+            fresh_object, _append_page(uri, _page), verify_ssl=verify_ssl, timeout=timeout
+        )
+
+    # Return the first response as-is if it does not contain any records (e.g. an error response)
+    response = await _get_page(page)
+    if not isinstance(response, dict) or not response.get(data_key):
+        return response
+    records = list(response[data_key])
+    if len(response[data_key]) < page_size:
+        return {data_key: records}
+
+    # Retrieve the remaining pages in batches while preserving the page order
+    last_page = page + PAGE_LIMIT - 1
+    while page < last_page:
+        pages = range(page + 1, min(page + concurrency, last_page) + 1)
+        for response in await asyncio.gather(*(_get_page(_page) for _page in pages)):
+            # An error response for a subsequent page must not be mistaken for the end of the data
+            if not isinstance(response, dict) or data_key not in response:
+                _raise_exception_for_unexpected_response(response)
+            page_records = response[data_key]
+            if not page_records:
+                return {data_key: records}
+            records.extend(page_records)
+            if len(page_records) < page_size:
+                return {data_key: records}
+        page = pages[-1]
+    _raise_exception_for_page_limit()
+
+
+def _get_cache_key(_fresh_object, _uri, _headers, _return_json):
+    """This function defines the key used to cache a JSON response when caching is enabled.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _uri: The URI being queried
+    :type _uri: str
+    :param _headers: The HTTP headers utilized in the REST API call
+    :type _headers: dict, None
+    :param _return_json: Determines if JSON data should be returned
+    :type _return_json: bool
+    :returns: The cache key as a tuple or ``None`` if the response should not be cached
+    """
+    if not _return_json or not _fresh_object.cache_ttl:
+        return None
+    return _uri, frozenset((_headers or {}).items())
+
+
+def _get_cached_response(_fresh_object, _cache_key):
+    """This function retrieves a cached JSON response if it exists and has not expired.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: A deep copy of the cached data is returned so that it can be safely modified by the caller.
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _cache_key: The key for the cached response (the URI and the request headers)
+    :type _cache_key: tuple
+    :returns: The cached JSON data or ``None`` if there is no valid cached response
+    """
+    with _fresh_object._cache_lock:
+        _cached = _fresh_object._cache.get(_cache_key)
+        if _cached is None:
+            return None
+        _cached_time, _cached_response = _cached
+        if time.monotonic() - _cached_time > _fresh_object.cache_ttl:
+            del _fresh_object._cache[_cache_key]
+            return None
+        _fresh_object._cache.move_to_end(_cache_key)
+
+    # Return a copy so that changes made by the caller do not affect the cached data
+    return copy.deepcopy(_cached_response)
+
+
+def _cache_response(_fresh_object, _cache_key, _response):
+    """This function caches a JSON response and evicts the least recently used entries when necessary.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: A deep copy of the data is cached so that changes to the returned data do not affect the cache.
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _cache_key: The key for the cached response (the URI and the request headers)
+    :type _cache_key: tuple
+    :param _response: The JSON data to be cached
+    :returns: None
+    """
+    _response = copy.deepcopy(_response)
+    with _fresh_object._cache_lock:
+        _fresh_object._cache[_cache_key] = (time.monotonic(), _response)
+        _fresh_object._cache.move_to_end(_cache_key)
+        while len(_fresh_object._cache) > _fresh_object.cache_maxsize:
+            _fresh_object._cache.popitem(last=False)
 
 
 def _report_failed_attempt(_exc_msg, _request_type, _retries):
     """This function reports a failed API call that will be retried.
 
+    .. versionchanged:: 2.1.0
+       Unrecoverable exceptions are now handled by the caller, so the exception is no longer re-raised here,
+       and the failure is now reported using the module logger rather than printed to ``sys.stderr``.
+
     .. versionchanged:: 2.0.0
        Replaced a generic py:exc:`Exception` with a py:exc:`RuntimeError` exception.
 
@@ -121,27 +900,222 @@ def _report_failed_attempt(_exc_msg, _request_type, _retries):
     :type _retries: int
     :returns: None
     """
-    _exc_name = type(_exc_msg).__name__
-    if "connect" not in _exc_name.lower():
-        raise RuntimeError(f"{_exc_name}: {_exc_msg}")
-    _current_attempt = f"(Attempt {_retries} of 5)"
-    _error_msg = (
-        f"The {_request_type.upper()} request has failed with the following exception: "
-        + f"{_exc_name}: {_exc_msg} {_current_attempt}"
+    logger.warning(
+        "The %s request has failed with the following exception: %s: %s (Attempt %d of %d)",
+        _request_type.upper(), type(_exc_msg).__name__, _exc_msg, _retries, MAX_RETRIES,
     )
-    errors.handlers.eprint(f"{_error_msg}\n{_exc_name}: {_exc_msg}\n")
 
 
-def _raise_exception_for_repeated_timeouts():
+class BackoffStrategy(object):
+    """This class waits between the retries of an API request either synchronously or asynchronously.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The delay is calculated by the :py:func:`freshpy.api._compute_delay` function, and an exception is
+              raised rather than waiting when the retry would occur after the deadline of the request.
+    """
+    def __init__(self, uri=None, deadline=None, timeout=None, base_delay=BASE_RETRY_DELAY, max_delay=MAX_RETRY_DELAY):
+        """This method instantiates the :py:class:`freshpy.api.BackoffStrategy` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param uri: The URI being queried (used when reporting the retries)
+        :type uri: str, None
+        :param deadline: The absolute :py:func:`time.monotonic` value by which the request must complete
+        :type deadline: float, None
+        :param timeout: The timeout (in seconds) used to define the deadline
+        :type timeout: int, float, None
+        :param base_delay: The delay (in seconds) used for the first retry (``1.0`` by default)
+        :type base_delay: int, float
+        :param max_delay: The maximum delay (in seconds) between retries (``30.0`` by default)
+        :type max_delay: int, float
+        """
+        self.uri = uri
+        self.deadline = deadline
+        self.timeout = timeout
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def wait(self, attempt, response=None):
+        """This method blocks the current thread until the next attempt should be performed.
+
+        .. versionadded:: 2.1.0
+
+        :param attempt: The attempt number for the API request
+        :type attempt: int
+        :param response: The response that triggered the retry (``None`` for failed connections)
+        :returns: The delay in seconds as a float
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+        """
+        delay = self._get_delay(attempt, response)
+        time.sleep(delay)
+        return delay
+
+    async def awaitable(self, attempt, response=None):
+        """This method suspends the current coroutine (without blocking the event loop) until the next attempt.
+
+        .. versionadded:: 2.1.0
+
+        :param attempt: The attempt number for the API request
+        :type attempt: int
+        :param response: The response that triggered the retry (``None`` for failed connections)
+        :returns: The delay in seconds as a float
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+        """
+        delay = self._get_delay(attempt, response)
+        await asyncio.sleep(delay)
+        return delay
+
+    def _get_delay(self, attempt, response=None):
+        """This method calculates the delay before the next attempt and reports throttled or unavailable responses.
+
+        .. versionadded:: 2.1.0
+
+        :param attempt: The attempt number for the API request
+        :type attempt: int
+        :param response: The response that triggered the retry (``None`` for failed connections)
+        :returns: The delay in seconds as a float
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+        """
+        retry_after = _parse_retry_after(response) if response is not None else None
+        delay = _compute_delay(attempt, retry_after, self.base_delay, self.max_delay)
+
+        # Fail immediately rather than waiting if the retry would occur after the deadline
+        if self.deadline is not None and delay >= self.deadline - time.monotonic():
+            _raise_exception_for_exceeded_deadline(self.timeout, retry_after)
+        if response is not None:
+            logger.warning(
+                "The GET request for %s returned a %s response. Retrying in %.2fs (Attempt %d of %d)",
+                self.uri, response.status_code, delay, attempt, MAX_RETRIES,
+            )
+        return delay
+
+
+def _compute_delay(_attempt, _retry_after=None, _base_delay=BASE_RETRY_DELAY, _max_delay=MAX_RETRY_DELAY):
+    """This function calculates how long to wait before retrying a throttled or failed API call.
+
+    .. versionadded:: 2.1.0
+
+    :param _attempt: The attempt number for the API request
+    :type _attempt: int
+    :param _retry_after: The number of seconds requested by the ``Retry-After`` header (if any)
+    :type _retry_after: float, None
+    :param _base_delay: The delay (in seconds) used for the first retry
+    :type _base_delay: int, float
+    :param _max_delay: The maximum delay (in seconds) between retries
+    :type _max_delay: int, float
+    :returns: The delay in seconds as a float
+    """
+    if _retry_after is not None:
+        return _retry_after
+
+    # Use full jitter so that concurrent clients do not retry in lockstep
+    return random.uniform(0, min(_max_delay, _base_delay * (2 ** _attempt)))
+
+
+def _parse_retry_after(_response):
+    """This function parses the ``Retry-After`` header of a response.
+
+    .. versionadded:: 2.1.0
+
+    :param _response: The :py:mod:`requests` or :py:mod:`httpx` response
+    :returns: The non-negative number of seconds as a float or ``None`` if the header is missing or is not a
+              finite number of seconds (in which case the computed backoff delay is used instead)
+    """
+    _retry_after = _response.headers.get("Retry-After")
+    if _retry_after:
+        try:
+            _retry_after = float(_retry_after)
+        except ValueError:
+            # The header may be an HTTP date rather than a number of seconds
+            return None
+        if math.isfinite(_retry_after):
+            return max(0.0, _retry_after)
+    return None
+
+
+def _define_deadline(_timeout=None, _deadline=None):
+    """This function defines the absolute deadline by which an API request (including retries) must complete.
+
+    .. versionadded:: 2.1.0
+
+    :param _timeout: The maximum number of seconds to spend on the request (``None`` for no limit)
+    :type _timeout: int, float, None
+    :param _deadline: An existing absolute :py:func:`time.monotonic` deadline which takes precedence
+    :type _deadline: float, None
+    :returns: The deadline as a :py:func:`time.monotonic` value or ``None`` if there is no limit
+    """
+    if _deadline is not None:
+        return _deadline
+    if _timeout is None:
+        return None
+    return time.monotonic() + _timeout
+
+
+def _get_request_timeout(_deadline=None, _timeout=None):
+    """This function defines the connect and read timeouts for a single request based on the remaining time.
+
+    .. versionadded:: 2.1.0
+
+    :param _deadline: The absolute :py:func:`time.monotonic` value by which the request must complete
+    :type _deadline: float, None
+    :param _timeout: The timeout (in seconds) used to define the deadline
+    :type _timeout: int, float, None
+    :returns: A tuple with the connect and read timeouts in seconds
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+    """
+    if _deadline is None:
+        return CONNECT_TIMEOUT, READ_TIMEOUT
+    _remaining = _deadline - time.monotonic()
+    if _remaining <= 0:
+        _raise_exception_for_exceeded_deadline(_timeout)
+    return min(CONNECT_TIMEOUT, _remaining), min(READ_TIMEOUT, _remaining)
+
+
+def _raise_exception_for_exceeded_deadline(_timeout=None, _retry_after=None):
+    """This function raises an exception when an API request could not be completed before its deadline.
+
+    .. versionadded:: 2.1.0
+
+    :param _timeout: The timeout (in seconds) used to define the deadline
+    :type _timeout: int, float, None
+    :param _retry_after: The number of seconds requested by the ``Retry-After`` header that exceeded the deadline
+    :type _retry_after: float, None
+    :returns: None
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+    """
+    _failure_msg = "The API request could not be completed before the deadline was exceeded."
+    if _timeout is not None:
+        _failure_msg = f"The API request could not be completed within the {_timeout} second timeout."
+    if _retry_after is not None:
+        _failure_msg += (
+            f" The API was throttled and the server requested a retry after {_retry_after:g} seconds, which "
+            + "exceeds the remaining time. Increase the timeout to wait for the throttling to end."
+        )
+    raise errors.exceptions.APIConnectionError(_failure_msg)
+
+
+def _raise_exception_for_repeated_timeouts(_response=None):
     """This function raises an exception when all API attempts (including) retries resulted in a timeout.
 
+    .. versionchanged:: 2.1.0
+       The exception message now reflects repeated throttled or unavailable responses when applicable.
+
     .. versionadded:: 1.0.0
 
+    :param _response: The last :py:mod:`requests` response received (if any)
     :returns: None
     :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
     """
-    _failure_msg = (
-        "The script was unable to complete successfully after five consecutive API timeouts. "
-        + "Please run the script again or contact Freshservice Support for further assistance."
-    )
+    if _response is not None:
+        _failure_msg = (
+            f"The script was unable to complete successfully after {MAX_RETRIES + 1} consecutive "
+            + f"{_response.status_code} responses. Please run the script again or contact Freshservice "
+            + "Support for further assistance."
+        )
+    else:
+        _failure_msg = (
+            "The script was unable to complete successfully after five consecutive API timeouts. "
+            + "Please run the script again or contact Freshservice Support for further assistance."
+        )
     raise errors.exceptions.APIConnectionError(_failure_msg)
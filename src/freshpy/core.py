@@ -7,6 +7,16 @@
 :Modified Date:     29 Jan 2025
 """
 
+import re
+import asyncio
+import collections
+import threading
+import importlib.util
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+
 from . import api, errors
 from . import tickets as tickets_module
 from . import agents as agents_module
@@ -15,39 +25,221 @@ from .utils import log_utils, version
 # Initialize logging
 logger = log_utils.initialize_logging(__name__)
 
+# Define the current version once rather than for each instantiated object
+_VERSION = version.get_full_version()
+
+# Define the pattern used to validate the network location (i.e. host and optional port) of the domain
+NETLOC_PATTERN = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9.-]*[A-Za-z0-9])?(?::\d+)?$")
+
 
 class FreshPy(object):
     """This is the class for the core object leveraged in this library."""
 
     # Define the function that initializes the object instance (i.e. instantiates the object)
-    def __init__(self, domain=None, api_key=None):
+    def __init__(self, domain=None, api_key=None, cache_ttl=None, cache_maxsize=256):
         """This method instantiates the core Fresh object.
 
+        .. versionchanged:: 2.1.0
+           Introduced the ``cache_ttl`` and ``cache_maxsize`` parameters to optionally cache GET responses.
+
         .. versionadded:: 1.0.0
+
+        :param domain: The Freshservice domain (e.g. ``example.freshservice.com``)
+        :type domain: str
+        :param api_key: The API key used to authenticate
+        :type api_key: str
+        :param cache_ttl: The number of seconds to cache JSON responses for GET requests (disabled by default)
+        :type cache_ttl: int, float, None
+        :param cache_maxsize: The maximum number of responses to keep in the cache (``256`` by default)
+        :type cache_maxsize: int
+        :raises: :py:exc:`freshpy.errors.exceptions.MissingRequiredDataError`,
+                 :py:exc:`freshpy.errors.exceptions.InvalidURLError`
         """
         # Define the current version
-        self.version = version.get_full_version()
+        self.version = _VERSION
 
         # Raise an exception if the domain and API key were not supplied
         if not domain or not api_key:
             raise errors.exceptions.MissingRequiredDataError("init")
 
-        # Define the domain
-        domain = (
-            f"https://{domain}" if domain and not domain.startswith("http") else domain
-        )
-        domain = domain[:-1] if domain.endswith("/") else domain
-        self.domain = domain
+        # Parse and validate the domain
+        self._parsed_domain = self._parse_domain(domain)
+        self.domain = f"{self._parsed_domain.scheme}://{self._parsed_domain.netloc}"
 
         # Define the base URL
-        self.base_url = f"{domain}/api/v2/"
+        self.base_url = f"{self.domain}/api/v2/"
 
         # Define the API key
         self.api_key = api_key
 
-        # Import inner object classes so their methods can be called from the primary object
-        self.agents = self._import_agents_class()
-        self.tickets = self._import_tickets_class()
+        # Define the default headers and credentials once rather than for each API call
+        self._default_headers = api.define_headers()
+        self._auth = api.define_auth(api_key)
+
+        # Define the session used for API calls so that connections can be reused
+        self.session = self._define_session()
+
+        # Define the optional response cache for GET requests
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self._cache = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Define the GET requests that are in progress so that identical concurrent requests can be coalesced
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+        # Define the asynchronous clients (which are created when first needed)
+        self._async_clients = {}
+
+        # Define the inner object classes (which are imported when first accessed)
+        self._agents = None
+        self._tickets = None
+
+    @staticmethod
+    def _parse_domain(domain):
+        """This method parses the domain into a :py:class:`urllib.parse.SplitResult` (using HTTPS by default).
+
+        .. versionadded:: 2.1.0
+
+        :param domain: The Freshservice domain (e.g. ``example.freshservice.com``)
+        :type domain: str
+        :returns: The parsed domain as a :py:class:`urllib.parse.SplitResult` object
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidURLError`
+        """
+        parsed_domain = urllib.parse.urlsplit(domain if "://" in domain else f"https://{domain}")
+        if parsed_domain.scheme not in ("http", "https") or not NETLOC_PATTERN.match(parsed_domain.netloc):
+            raise errors.exceptions.InvalidURLError(url=domain)
+        return parsed_domain
+
+    def _define_session(self):
+        """This method defines the :py:class:`requests.Session` leveraged by the core object for API calls.
+
+        .. versionadded:: 2.1.0
+
+        :returns: The :py:class:`requests.Session` object with a pooled connection adapter
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        session.mount("https://", adapter)
+        session.auth = self._auth
+        session.headers.update(self._default_headers)
+        return session
+
+    async def _get_async_client(self, verify_ssl=True):
+        """This method returns the :py:class:`httpx.AsyncClient` used for asynchronous API calls, creating it if needed.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: The client is bound to the event loop that created it and is closed automatically when that event
+                  loop shuts down its asynchronous generators (e.g. at the end of :py:func:`asyncio.run`).
+
+        :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+        :type verify_ssl: bool
+        :returns: The :py:class:`httpx.AsyncClient` object
+        :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+        """
+        if api.httpx is None:
+            raise errors.exceptions.MissingDependencyError(package="httpx")
+
+        # Replace the client if it was created by an event loop that is no longer in use
+        loop = asyncio.get_running_loop()
+        client, client_loop, _ = self._async_clients.get(verify_ssl, (None, None, None))
+        if client is not None and client_loop is not loop:
+            self._close_async_client(self._async_clients.pop(verify_ssl))
+            client = None
+        if client is None:
+            # HTTP/2 multiplexing is only available when the optional h2 package is installed
+            http2 = importlib.util.find_spec("h2") is not None
+            client = api.httpx.AsyncClient(
+                base_url=self.base_url,
+                auth=self._auth,
+                headers=self._default_headers,
+                verify=verify_ssl,
+                http2=http2,
+                limits=api.httpx.Limits(max_connections=20),
+            )
+            lifetime = self._manage_async_client(client)
+            await lifetime.__anext__()
+            self._async_clients[verify_ssl] = (client, loop, lifetime)
+        return client
+
+    @staticmethod
+    async def _manage_async_client(_client):
+        """This method is an asynchronous generator that closes an :py:class:`httpx.AsyncClient` when it is closed.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: Event loops close any unfinished asynchronous generators before they are closed, which ensures
+                  the connections of the client are released within the event loop that opened them.
+
+        :param _client: The :py:class:`httpx.AsyncClient` object
+        :returns: An asynchronous generator that yields once
+        """
+        try:
+            yield
+        finally:
+            await _client.aclose()
+
+    @staticmethod
+    def _close_async_client(_async_client):
+        """This method closes an :py:class:`httpx.AsyncClient` from synchronous code using the event loop that created it.
+
+        .. versionadded:: 2.1.0
+
+        :param _async_client: A tuple with the client, its event loop and the generator that manages its lifetime
+        :type _async_client: tuple
+        :returns: None
+        """
+        _client, _loop, _lifetime = _async_client
+        if _client.is_closed or _loop.is_closed():
+            return
+        try:
+            _running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _running_loop = None
+        if _running_loop is _loop:
+            _loop.create_task(_lifetime.aclose())
+        elif _loop.is_running():
+            asyncio.run_coroutine_threadsafe(_lifetime.aclose(), _loop)
+        elif _running_loop is None:
+            _loop.run_until_complete(_lifetime.aclose())
+
+    def invalidate_cache(self, prefix=None):
+        """This method removes cached GET responses so that subsequent calls retrieve fresh data.
+
+        .. versionadded:: 2.1.0
+
+        :param prefix: Only remove cached responses for URIs starting with this value (all are removed by default)
+        :type prefix: str, None
+        :returns: None
+        """
+        with self._cache_lock:
+            if prefix is None:
+                self._cache.clear()
+            else:
+                for key in [key for key in self._cache if key[0].startswith(prefix)]:
+                    del self._cache[key]
+
+    @property
+    def agents(self):
+        """This property returns the :py:class:`freshpy.core.FreshPy.Agents` inner class object.
+
+        .. versionadded:: 2.1.0
+        """
+        if self._agents is None:
+            self._agents = self._import_agents_class()
+        return self._agents
+
+    @property
+    def tickets(self):
+        """This property returns the :py:class:`freshpy.core.FreshPy.Tickets` inner class object.
+
+        .. versionadded:: 2.1.0
+        """
+        if self._tickets is None:
+            self._tickets = self._import_tickets_class()
+        return self._tickets
 
     def _import_agents_class(self):
         """This method allows the :py:class:`freshpy.core.FreshPy.Agents` class to be utilized in the core object.
@@ -63,9 +255,23 @@ class FreshPy(object):
         """
         return FreshPy.Tickets(self)
 
-    def get(self, uri, headers=None, return_json=True, verify_ssl=True):
+    def get(
+        self,
+        uri,
+        headers=None,
+        return_json=True,
+        verify_ssl=True,
+        timeout=api.DEFAULT_TIMEOUT,
+        deadline=None,
+        stream=False,
+        stream_prefix="item",
+    ):
         """This method performs a GET request against the Freshservice API with multiple retries on failure.
 
+        .. versionchanged:: 2.1.0
+           Introduced the ``timeout`` and ``deadline`` parameters to limit the total time spent across all retries,
+           and the ``stream`` and ``stream_prefix`` parameters to incrementally parse large JSON responses.
+
         .. versionchanged:: 1.1.0
            Added the ability to disable SSL verification on API calls.
 
@@ -79,13 +285,90 @@ class FreshPy(object):
         :type return_json: bool
         :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
         :type verify_ssl: bool
-        :returns: The JSON data from the response or the raw :py:mod:`requests` response.
-        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+        :param timeout: The maximum number of seconds to spend on the request including retries (``120`` by default)
+                        (the default allows a throttled request to wait out a per-minute rate limit window, whereas
+                        a ``Retry-After`` delay longer than the remaining time raises an exception immediately,
+                        so use ``None`` to always wait for the delay requested by the server)
+        :type timeout: int, float, None
+        :param deadline: An absolute :py:func:`time.monotonic` value by which the request must complete
+                         (overrides the ``timeout`` parameter when defined)
+        :type deadline: float, None
+        :param stream: Returns a generator that parses the JSON records as they are received when ``True``
+                       (requires the optional :py:mod:`ijson` package)
+        :type stream: bool
+        :param stream_prefix: The :py:mod:`ijson` prefix of the records to yield when streaming (``item`` by default)
+        :type stream_prefix: str
+        :returns: The JSON data from the response (or a generator of records when streaming) or the raw
+                  :py:mod:`requests` response.
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                 :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
         """
         return api.get_request_with_retries(
-            self, uri, headers, return_json, verify_ssl=verify_ssl
+            self,
+            uri,
+            headers,
+            return_json,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+            deadline=deadline,
+            stream=stream,
+            stream_prefix=stream_prefix,
+        )
+
+    async def aget(
+        self,
+        uri,
+        headers=None,
+        return_json=True,
+        verify_ssl=True,
+        timeout=api.DEFAULT_TIMEOUT,
+        deadline=None,
+    ):
+        """This method asynchronously performs a GET request against the Freshservice API with multiple retries on failure.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: This method requires the optional :py:mod:`httpx` package.
+
+        :param uri: The URI to query
+        :type uri: string
+        :param headers: The HTTP headers to utilize in the REST API call
+        :type headers: dict, None
+        :param return_json: Determines if JSON data should be returned
+        :type return_json: bool
+        :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+        :type verify_ssl: bool
+        :param timeout: The maximum number of seconds to spend on the request including retries (``120`` by default)
+                        (the default allows a throttled request to wait out a per-minute rate limit window, whereas
+                        a ``Retry-After`` delay longer than the remaining time raises an exception immediately,
+                        so use ``None`` to always wait for the delay requested by the server)
+        :type timeout: int, float, None
+        :param deadline: An absolute :py:func:`time.monotonic` value by which the request must complete
+                         (overrides the ``timeout`` parameter when defined)
+        :type deadline: float, None
+        :returns: The JSON data from the response or the raw :py:mod:`httpx` response.
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                 :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+        """
+        return await api.aget_request_with_retries(
+            self,
+            uri,
+            headers,
+            return_json,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+            deadline=deadline,
         )
 
+    async def aclose(self):
+        """This method closes the asynchronous clients used for asynchronous API calls.
+
+        .. versionadded:: 2.1.0
+        """
+        while self._async_clients:
+            _, (_, _, lifetime) = self._async_clients.popitem()
+            await lifetime.aclose()
+
     class Agents(object):
         """This class includes methods associated with Freshservice agents."""
 
@@ -130,9 +413,21 @@ class FreshPy(object):
                 self.freshpy_object, lookup_value=lookup_value, verify_ssl=verify_ssl
             )
 
-        def get_all_agents(self, only_active=None, only_inactive=None, verify_ssl=True):
+        def get_all_agents(
+            self,
+            only_active=None,
+            only_inactive=None,
+            verify_ssl=True,
+            all_pages=False,
+            concurrency=api.DEFAULT_CONCURRENCY,
+            timeout=api.DEFAULT_TIMEOUT,
+        ):
             """This function returns data for all agents with an optional filters for active or inactive users.
 
+            .. versionchanged:: 2.1.0
+               Introduced the ``all_pages`` and ``concurrency`` parameters to retrieve all pages concurrently
+               and the ``timeout`` parameter to limit the time spent on each request.
+
             .. versionadded:: 2.0.0
 
             :param only_active: Filters for only active agents when ``True``
@@ -141,14 +436,24 @@ class FreshPy(object):
             :type only_inactive: bool, None
             :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
             :type verify_ssl: bool
+            :param all_pages: Retrieves all pages of agents when ``True`` (only the first page is returned by default)
+            :type all_pages: bool
+            :param concurrency: The maximum number of pages to retrieve concurrently when ``all_pages`` is ``True``
+            :type concurrency: int
+            :param timeout: The maximum number of seconds to spend on each request including retries (``120`` by default)
+            :type timeout: int, float, None
             :returns: JSON data with user data for all agents
-            :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+            :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`
             """
             return agents_module.get_all_agents(
                 self.freshpy_object,
                 only_active=only_active,
                 only_inactive=only_inactive,
                 verify_ssl=verify_ssl,
+                all_pages=all_pages,
+                concurrency=concurrency,
+                timeout=timeout,
             )
 
         def get_agent_id(self, email, verify_ssl=True):
@@ -265,9 +570,17 @@ class FreshPy(object):
             per_page=None,
             page=None,
             verify_ssl=True,
+            all_pages=False,
+            concurrency=api.DEFAULT_CONCURRENCY,
+            timeout=api.DEFAULT_TIMEOUT,
         ):
             """This method returns a sequence of tickets with optional filters.
 
+            .. versionchanged:: 2.1.0
+               Introduced the ``all_pages`` and ``concurrency`` parameters to retrieve all pages concurrently
+               and the ``timeout`` parameter to limit the time spent on each request. The ``per_page`` parameter
+               now defaults to the maximum of ``100`` results.
+
             .. versionchanged:: 1.1.0
                Added the ability to disable SSL verification on API calls.
 
@@ -293,15 +606,22 @@ class FreshPy(object):
             :type ascending: bool, None
             :param descending: Determines if the tickets should be sorted in *descending* order (default)
             :type descending: bool, None
-            :param per_page: Displays a certain number of results per query
+            :param per_page: Displays a certain number of results per query (``100`` by default)
             :type per_page: str, int, None
             :param page: Returns a specific page number (used for paginated results)
             :type page: str, int, None
             :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
             :type verify_ssl: bool
+            :param all_pages: Retrieves all pages (beginning with ``page`` if defined) when ``True``
+            :type all_pages: bool
+            :param concurrency: The maximum number of pages to retrieve concurrently when ``all_pages`` is ``True``
+            :type concurrency: int
+            :param timeout: The maximum number of seconds to spend on each request including retries (``120`` by default)
+            :type timeout: int, float, None
             :returns: A list of JSON objects for tickets
             :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
-                     :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+                     :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`
             """
             return tickets_module.get_tickets(
                 self.freshpy_object,
@@ -318,6 +638,117 @@ class FreshPy(object):
                 ascending=ascending,
                 descending=descending,
                 verify_ssl=verify_ssl,
+                all_pages=all_pages,
+                concurrency=concurrency,
+                timeout=timeout,
+            )
+
+        def iter_tickets(
+            self,
+            include=None,
+            predefined_filter=None,
+            filters=None,
+            filter_logic="AND",
+            requester_id=None,
+            requester_email=None,
+            ticket_type=None,
+            updated_since=None,
+            ascending=None,
+            descending=None,
+            per_page=None,
+            page=None,
+            verify_ssl=True,
+            timeout=api.DEFAULT_TIMEOUT,
+            stream=False,
+        ):
+            """This method yields tickets with optional filters one at a time, retrieving the pages as needed.
+
+            .. versionadded:: 2.1.0
+
+            .. note:: This method accepts the same parameters as the :py:meth:`freshpy.core.FreshPy.Tickets.get_tickets`
+                      method (with ``page`` defining the first page) and holds at most two pages of tickets in
+                      memory (the current page and the next page, which is retrieved in the background). Each
+                      page is also kept in the response cache (up to ``cache_maxsize`` pages) when the ``cache_ttl``
+                      of the core object is defined, unless ``stream`` is ``True``.
+
+            :param stream: Parses the tickets incrementally as each page is received (requires the :py:mod:`ijson`
+                           package) so that only a single ticket is held in memory
+            :type stream: bool
+            :returns: A generator that yields the JSON data for each ticket
+            :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
+                     :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`,
+                     :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+            """
+            return tickets_module.iter_tickets(
+                self.freshpy_object,
+                include=include,
+                predefined_filter=predefined_filter,
+                filters=filters,
+                filter_logic=filter_logic,
+                requester_id=requester_id,
+                per_page=per_page,
+                page=page,
+                requester_email=requester_email,
+                ticket_type=ticket_type,
+                updated_since=updated_since,
+                ascending=ascending,
+                descending=descending,
+                verify_ssl=verify_ssl,
+                timeout=timeout,
+                stream=stream,
+            )
+
+        async def aget_tickets(
+            self,
+            include=None,
+            predefined_filter=None,
+            filters=None,
+            filter_logic="AND",
+            requester_id=None,
+            requester_email=None,
+            ticket_type=None,
+            updated_since=None,
+            ascending=None,
+            descending=None,
+            per_page=None,
+            page=None,
+            verify_ssl=True,
+            all_pages=False,
+            concurrency=api.DEFAULT_CONCURRENCY,
+            timeout=api.DEFAULT_TIMEOUT,
+        ):
+            """This method asynchronously returns a sequence of tickets with optional filters.
+
+            .. versionadded:: 2.1.0
+
+            .. note:: This method requires the optional :py:mod:`httpx` package and accepts the same parameters
+                      as the :py:meth:`freshpy.core.FreshPy.Tickets.get_tickets` method.
+
+            :returns: A list of JSON objects for tickets
+            :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
+                     :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`,
+                     :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+            """
+            return await tickets_module.aget_tickets(
+                self.freshpy_object,
+                include=include,
+                predefined_filter=predefined_filter,
+                filters=filters,
+                filter_logic=filter_logic,
+                requester_id=requester_id,
+                per_page=per_page,
+                page=page,
+                requester_email=requester_email,
+                ticket_type=ticket_type,
+                updated_since=updated_since,
+                ascending=ascending,
+                descending=descending,
+                verify_ssl=verify_ssl,
+                all_pages=all_pages,
+                concurrency=concurrency,
+                timeout=timeout,
             )
 
     def __del__(self):
@@ -325,10 +756,19 @@ class FreshPy(object):
 
         .. versionadded:: 1.0.0
         """
-        self.close()
+        if hasattr(self, "session"):
+            self.close()
 
     def close(self):
         """This core method destroys the instance.
 
+        .. versionchanged:: 2.1.0
+           The method now closes the underlying :py:class:`requests.Session` object and any
+           :py:class:`httpx.AsyncClient` objects used for asynchronous API calls.
+
         .. versionadded:: 1.0.0
         """
+        self.session.close()
+        while self._async_clients:
+            _, async_client = self._async_clients.popitem()
+            self._close_async_client(async_client)
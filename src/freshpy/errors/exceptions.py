@@ -128,6 +128,22 @@ class InvalidURLError(FreshPyError):
         super().__init__(*args)
 
 
+class MissingDependencyError(FreshPyError):
+    """This exception is used when an optional package required for a feature is not installed.
+
+    .. versionadded:: 2.1.0
+    """
+    def __init__(self, *args, **kwargs):
+        """This method defines the default or custom message for the exception."""
+        default_msg = "A package required for this feature is not installed."
+        if not (args or kwargs):
+            args = (default_msg,)
+        elif 'package' in kwargs:
+            custom_msg = f"The '{kwargs['package']}' package must be installed to use this feature."
+            args = (custom_msg,)
+        super().__init__(*args)
+
+
 class MissingRequiredDataError(FreshPyError):
     """This exception is used when a function or method is missing one or more required arguments.
 
@@ -28,6 +28,7 @@ SUPPORTED_FILTER_FIELDS = [
     "created_at",
 ]
 FILTER_LOGIC_OPERATORS = ["AND", "OR"]
+MAX_PER_PAGE = 100
 
 
 def get_ticket(
@@ -189,9 +190,17 @@ def get_tickets(
     per_page=None,
     page=None,
     verify_ssl=True,
+    all_pages=False,
+    concurrency=api.DEFAULT_CONCURRENCY,
+    timeout=api.DEFAULT_TIMEOUT,
 ):
     """This function returns a sequence of tickets with optional filters.
 
+    .. versionchanged:: 2.1.0
+       Introduced the ``all_pages`` and ``concurrency`` parameters to retrieve all pages concurrently
+       and the ``timeout`` parameter to limit the time spent on each request. The ``per_page`` parameter
+       now defaults to the maximum of ``100`` results.
+
     .. versionchanged:: 1.1.0
        Added the ability to disable SSL verification on API calls.
 
@@ -218,33 +227,279 @@ def get_tickets(
     :type ascending: bool, None
     :param descending: Determines if the tickets should be sorted in *descending* order (default)
     :type descending: bool, None
-    :param per_page: Displays a certain number of results per query
+    :param per_page: Displays a certain number of results per query (``100`` by default)
     :type per_page: str, int, None
     :param page: Returns a specific page number (used for paginated results)
     :type page: str, int, None
     :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
     :type verify_ssl: bool
+    :param all_pages: Retrieves all pages (beginning with ``page`` if defined) when ``True``
+    :type all_pages: bool
+    :param concurrency: The maximum number of pages to retrieve concurrently when ``all_pages`` is ``True``
+    :type concurrency: int
+    :param timeout: The maximum number of seconds to spend on each request including retries (``120`` by default)
+    :type timeout: int, float, None
     :returns: A list of JSON objects for tickets
     :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
-             :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+             :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    per_page = MAX_PER_PAGE if per_page is None else per_page
+    uri = _construct_tickets_uri(
+        _include=include,
+        _predefined_filter=predefined_filter,
+        _filters=filters,
+        _filter_logic=filter_logic,
+        _requester_id=requester_id,
+        _requester_email=requester_email,
+        _ticket_type=ticket_type,
+        _updated_since=updated_since,
+        _ascending=ascending,
+        _descending=descending,
+        _per_page=per_page,
+        _page=None if all_pages else page,
+    )
+    if all_pages:
+        return api.get_all_pages(
+            freshpy_object,
+            uri,
+            "tickets",
+            page_size=None if filters else per_page,
+            start_page=page or 1,
+            concurrency=concurrency,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+        )
+    return api.get_request_with_retries(
+        freshpy_object, uri, verify_ssl=verify_ssl, timeout=timeout
+    )
+
+
+def iter_tickets(
+    freshpy_object,
+    include=None,
+    predefined_filter=None,
+    filters=None,
+    filter_logic="AND",
+    requester_id=None,
+    requester_email=None,
+    ticket_type=None,
+    updated_since=None,
+    ascending=None,
+    descending=None,
+    per_page=None,
+    page=None,
+    verify_ssl=True,
+    timeout=api.DEFAULT_TIMEOUT,
+    stream=False,
+):
+    """This function yields tickets with optional filters one at a time, retrieving the pages as needed.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: At most two pages of tickets are held in memory (the current page and the next page, which is
+              retrieved in the background), unless the ``cache_ttl`` of the core object is defined, in which
+              case each page is also kept in the response cache (up to ``cache_maxsize`` pages). Streamed
+              pages are never cached.
+
+    :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
+    :type freshpy_object: class[freshpy.FreshPy]
+    :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+    :type include: str, tuple, list, set, None
+    :param predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
+    :type predefined_filter: str, None
+    :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
+    :type filters: str, dict, None
+    :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+    :param requester_id: The numeric ID of a requester
+    :type requester_id: str, int, None
+    :param requester_email: The email address of a requester
+    :type requester_email: str, None
+    :param ticket_type: The type of ticket (e.g. ``Incident``, ``Service Request``, etc.)
+    :type ticket_type: str, None
+    :param updated_since: A date or timestamp (in UTC format) to be a threshold for when the ticket was last updated
+    :type updated_since: str, None
+    :param ascending: Determines if the tickets should be sorted in *ascending* order
+    :type ascending: bool, None
+    :param descending: Determines if the tickets should be sorted in *descending* order (default)
+    :type descending: bool, None
+    :param per_page: Displays a certain number of results per query (``100`` by default)
+    :type per_page: str, int, None
+    :param page: The page number with which to begin (``1`` by default)
+    :type page: str, int, None
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param timeout: The maximum number of seconds to spend on each request including retries (``120`` by default)
+    :type timeout: int, float, None
+    :param stream: Parses the tickets incrementally as each page is received (requires the :py:mod:`ijson` package)
+    :type stream: bool
+    :returns: A generator that yields the JSON data for each ticket
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
+             :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`,
+             :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    per_page = MAX_PER_PAGE if per_page is None else per_page
+    uri = _construct_tickets_uri(
+        _include=include,
+        _predefined_filter=predefined_filter,
+        _filters=filters,
+        _filter_logic=filter_logic,
+        _requester_id=requester_id,
+        _requester_email=requester_email,
+        _ticket_type=ticket_type,
+        _updated_since=updated_since,
+        _ascending=ascending,
+        _descending=descending,
+        _per_page=per_page,
+    )
+    return api.iter_all_pages(
+        freshpy_object,
+        uri,
+        "tickets",
+        page_size=None if filters else per_page,
+        start_page=page or 1,
+        verify_ssl=verify_ssl,
+        timeout=timeout,
+        stream=stream,
+    )
+
+
+async def aget_tickets(
+    freshpy_object,
+    include=None,
+    predefined_filter=None,
+    filters=None,
+    filter_logic="AND",
+    requester_id=None,
+    requester_email=None,
+    ticket_type=None,
+    updated_since=None,
+    ascending=None,
+    descending=None,
+    per_page=None,
+    page=None,
+    verify_ssl=True,
+    all_pages=False,
+    concurrency=api.DEFAULT_CONCURRENCY,
+    timeout=api.DEFAULT_TIMEOUT,
+):
+    """This function asynchronously returns a sequence of tickets with optional filters.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: This function requires the optional :py:mod:`httpx` package.
+
+    :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
+    :type freshpy_object: class[freshpy.FreshPy]
+    :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+    :type include: str, tuple, list, set, None
+    :param predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
+    :type predefined_filter: str, None
+    :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
+    :type filters: str, dict, None
+    :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+    :param requester_id: The numeric ID of a requester
+    :type requester_id: str, int, None
+    :param requester_email: The email address of a requester
+    :type requester_email: str, None
+    :param ticket_type: The type of ticket (e.g. ``Incident``, ``Service Request``, etc.)
+    :type ticket_type: str, None
+    :param updated_since: A date or timestamp (in UTC format) to be a threshold for when the ticket was last updated
+    :type updated_since: str, None
+    :param ascending: Determines if the tickets should be sorted in *ascending* order
+    :type ascending: bool, None
+    :param descending: Determines if the tickets should be sorted in *descending* order (default)
+    :type descending: bool, None
+    :param per_page: Displays a certain number of results per query (``100`` by default)
+    :type per_page: str, int, None
+    :param page: Returns a specific page number (used for paginated results)
+    :type page: str, int, None
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param all_pages: Retrieves all pages (beginning with ``page`` if defined) when ``True``
+    :type all_pages: bool
+    :param concurrency: The maximum number of pages to retrieve concurrently when ``all_pages`` is ``True``
+    :type concurrency: int
+    :param timeout: The maximum number of seconds to spend on each request including retries (``120`` by default)
+    :type timeout: int, float, None
+    :returns: A list of JSON objects for tickets
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
+             :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`,
+             :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    per_page = MAX_PER_PAGE if per_page is None else per_page
+    uri = _construct_tickets_uri(
+        _include=include,
+        _predefined_filter=predefined_filter,
+        _filters=filters,
+        _filter_logic=filter_logic,
+        _requester_id=requester_id,
+        _requester_email=requester_email,
+        _ticket_type=ticket_type,
+        _updated_since=updated_since,
+        _ascending=ascending,
+        _descending=descending,
+        _per_page=per_page,
+        _page=None if all_pages else page,
+    )
+    if all_pages:
+        return await api.aget_all_pages(
+            freshpy_object,
+            uri,
+            "tickets",
+            page_size=None if filters else per_page,
+            start_page=page or 1,
+            concurrency=concurrency,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+        )
+    return await api.aget_request_with_retries(
+        freshpy_object, uri, verify_ssl=verify_ssl, timeout=timeout
+    )
+
+
+def _construct_tickets_uri(
+    _include=None,
+    _predefined_filter=None,
+    _filters=None,
+    _filter_logic="AND",
+    _requester_id=None,
+    _requester_email=None,
+    _ticket_type=None,
+    _updated_since=None,
+    _ascending=None,
+    _descending=None,
+    _per_page=None,
+    _page=None,
+):
+    """This function constructs the URI used to retrieve a sequence of tickets.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Refer to the :py:func:`freshpy.tickets.get_tickets` function for details on the parameters.
+
+    :returns: The URI for the tickets endpoint including the query string
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`
     """
-    uri = "tickets"
-    if filters:
-        uri += _parse_filters(filters, filter_logic)
+    _uri = "tickets"
+    if _filters:
+        _uri += _parse_filters(_filters, _filter_logic)
     else:
-        uri += _parse_constraints(
-            _include=include,
-            _predefined_filter=predefined_filter,
-            _requester_id=requester_id,
-            _requester_email=requester_email,
-            _ticket_type=ticket_type,
-            _updated_since=updated_since,
-            _ascending=ascending,
-            _descending=descending,
-            _per_page=per_page,
-            _page=page,
+        _uri += _parse_constraints(
+            _include=_include,
+            _predefined_filter=_predefined_filter,
+            _requester_id=_requester_id,
+            _requester_email=_requester_email,
+            _ticket_type=_ticket_type,
+            _updated_since=_updated_since,
+            _ascending=_ascending,
+            _descending=_descending,
+            _per_page=_per_page,
+            _page=_page,
         )
-    return api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl)
+    return _uri
 
 
 def _parse_filters(_filters=None, _logic="AND"):
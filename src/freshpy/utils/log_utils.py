@@ -11,7 +11,10 @@
 
 import os
 import sys
+import queue
+import atexit
 import logging
+import threading
 import logging.handlers
 from pathlib import Path
 
@@ -33,21 +36,26 @@ HANDLER_DEFAULTS = {
 def initialize_logging(logger_name=None, log_level=None, formatter=None, debug=None, no_output=None, file_output=None,
                        file_log_level=None, log_file=None, overwrite_log_files=None, console_output=None,
                        console_log_level=None, syslog_output=None, syslog_log_level=None, syslog_address=None,
-                       syslog_port=None):
+                       syslog_port=None, queue_output=None, queue_log_level=None):
     """This function initializes logging within a specific module.
 
+    .. versionchanged:: 2.1.0
+       Introduced the ``queue_output`` and ``queue_log_level`` parameters to write console messages
+       from a background thread.
+
     .. versionadded:: 1.0.0
 
     .. todo:: Add details about the parameters
     """
     logger_name, log_levels, formatter = _apply_defaults(logger_name, formatter, debug, log_level, file_log_level,
-                                                         console_log_level, syslog_log_level)
-    log_level, file_log_level, console_log_level, syslog_log_level = _get_log_levels_from_dict(log_levels)
+                                                         console_log_level, syslog_log_level, queue_log_level)
+    (log_level, file_log_level, console_log_level, syslog_log_level,
+     queue_log_level) = _get_log_levels_from_dict(log_levels)
     logger = logging.getLogger(logger_name)
     logger = _set_logging_level(logger, log_level)
     logger = _add_handlers(logger, formatter, no_output, file_output, file_log_level, log_file, overwrite_log_files,
                            console_output, console_log_level, syslog_output, syslog_log_level, syslog_address,
-                           syslog_port)
+                           syslog_port, queue_output, queue_log_level)
     return logger
 
 
@@ -77,9 +85,47 @@ class LessThanFilter(logging.Filter):
         return 1 if record.levelno < self.max_level else 0
 
 
-def _apply_defaults(_logger_name, _formatter, _debug, _log_level, _file_level, _console_level, _syslog_level):
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """This class queues messages for a :py:class:`logging.handlers.QueueListener` that is started when first needed.
+
+    .. versionadded:: 2.1.0
+    """
+    def __init__(self, log_queue, *handlers):
+        """This method instantiates the :py:class:`freshpy.utils.log_utils.LazyQueueHandler` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param log_queue: The queue to which the messages are added
+        :type log_queue: queue.Queue
+        :param handlers: The handlers that write the messages from the background thread
+        """
+        super(LazyQueueHandler, self).__init__(log_queue)
+        self.listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def emit(self, record):
+        """This method starts the listener (if not already started) and adds the message to the queue.
+
+        .. versionadded:: 2.1.0
+        """
+        if not self._started:
+            with self._start_lock:
+                if not self._started:
+                    # Ensure any remaining messages are written when the interpreter exits
+                    self.listener.start()
+                    atexit.register(self.listener.stop)
+                    self._started = True
+        super(LazyQueueHandler, self).emit(record)
+
+
+def _apply_defaults(_logger_name, _formatter, _debug, _log_level, _file_level, _console_level, _syslog_level,
+                    _queue_level=None):
     """This function applies default values to the configuration settings if not explicitly defined.
 
+    .. versionchanged:: 2.1.0
+       Introduced the ``_queue_level`` parameter so that the queue handler honors the debug mode and general log level.
+
     .. versionadded:: 1.0.0
 
     :param _logger_name: The name of the logger instance
@@ -97,6 +143,7 @@ def _apply_defaults(_logger_name, _formatter, _debug, _log_level, _file_level, _
         'file': _file_level,
         'console': _console_level,
         'syslog': _syslog_level,
+        'queue': _queue_level,
     }
     _logger_name = LOGGING_DEFAULTS.get('logger_name') if not _logger_name else _logger_name
     if _debug:
@@ -118,6 +165,9 @@ def _apply_defaults(_logger_name, _formatter, _debug, _log_level, _file_level, _
 def _get_log_levels_from_dict(_log_levels):
     """This function returns the individual log level values from a dictionary.
 
+    .. versionchanged:: 2.1.0
+       The log level for the queue handler is now also returned.
+
     .. versionadded:: 1.0.0
 
     :param _log_levels: Dictionary containing log levels for different handlers
@@ -128,7 +178,8 @@ def _get_log_levels_from_dict(_log_levels):
     _file = _log_levels.get('file')
     _console = _log_levels.get('console')
     _syslog = _log_levels.get('syslog')
-    return _general, _file, _console, _syslog
+    _queue = _log_levels.get('queue')
+    return _general, _file, _console, _syslog, _queue
 
 
 def _set_logging_level(_logger, _log_level):
@@ -156,9 +207,9 @@ def _set_logging_level(_logger, _log_level):
 
 def _add_handlers(_logger, _formatter, _no_output, _file_output, _file_log_level, _log_file, _overwrite_log_files,
                   _console_output, _console_log_level, _syslog_output, _syslog_log_level, _syslog_address,
-                  _syslog_port):
+                  _syslog_port, _queue_output=None, _queue_log_level=None):
     # TODO: Add docstring
-    if _no_output or not any((_file_output, _console_output, _syslog_output)):
+    if _no_output or not any((_file_output, _console_output, _syslog_output, _queue_output)):
         _logger.addHandler(logging.NullHandler())
     else:
         if _file_output:
@@ -170,6 +221,9 @@ def _add_handlers(_logger, _formatter, _no_output, _file_output, _file_log_level
         if _syslog_output:
             # Add the SyslogHandler to the Logger object
             _logger = _add_syslog_handler(_logger, _syslog_log_level, _formatter, _syslog_address, _syslog_port)
+        if _queue_output:
+            # Add the QueueHandler to the Logger object
+            _logger = _add_queue_handler(_logger, _queue_log_level, _formatter)
     return _logger
 
 
@@ -281,3 +335,35 @@ def _add_syslog_handler(_logger, _log_level, _formatter, _address, _port):
     _handler.setFormatter(_formatter)
     _logger.addHandler(_handler)
     return _logger
+
+
+def _add_queue_handler(_logger, _log_level, _formatter):
+    """This function adds a :py:class:`logging.handlers.QueueHandler` to the :py:class:`logging.Logger` instance.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The messages are written to ``sys.stderr`` by a :py:class:`logging.handlers.QueueListener` running
+              in a background thread (which is started when the first message is logged) so that logging does
+              not block the calling thread. The messages are not propagated to ancestor loggers, as that would
+              write them a second time if the root logger is also configured.
+
+    :param _logger: The :py:class:`logging.Logger` instance
+    :param _log_level: The log level to set for the handler
+    :type _log_level: str
+    :param _formatter: The :py:class:`logging.Formatter` to apply to messages written by the listener
+    :type _formatter: Formatter
+    :returns: The :py:class:`logging.Logger` instance with the added :py:class:`logging.handlers.QueueHandler`
+    """
+    _log_level = HANDLER_DEFAULTS.get('console_log_level') if not _log_level else _log_level
+
+    # Configure the handler that writes the messages from the background thread
+    _stream_handler = logging.StreamHandler(sys.stderr)
+    _stream_handler = _set_logging_level(_stream_handler, _log_level)
+    _stream_handler.setFormatter(_formatter)
+
+    # Configure and add the QueueHandler
+    _handler = LazyQueueHandler(queue.Queue(-1), _stream_handler)
+    _handler = _set_logging_level(_handler, _log_level)
+    _logger.addHandler(_handler)
+    _logger.propagate = False
+    return _logger